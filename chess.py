@@ -10,10 +10,10 @@ RANKS = [RANK_1,
          RANK_5,
          RANK_6,
          RANK_7,
-         RANK_8,] = [0xff << i for i in range(0, 64, 8)]
+         RANK_8,] = tuple(0xff << i for i in range(0, 64, 8))
 
 # SAN symbols for the ranks on the board.
-RANK_SAN = ['1', '2', '3', '4', '5', '6', '7', '8']
+RANK_SAN = ('1', '2', '3', '4', '5', '6', '7', '8')
 
 # Masks for the files on the board.
 FILES = [FILE_A,
@@ -23,10 +23,10 @@ FILES = [FILE_A,
          FILE_E,
          FILE_F,
          FILE_G,
-         FILE_H,] = [0x0101010101010101 << i for i in range(8)]
+         FILE_H,] = tuple(0x0101010101010101 << i for i in range(8))
 
 # SAN symbols for the files on the board.
-FILE_SAN = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+FILE_SAN = ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h')
 
 # Masks for the squares on the board.
 SQUARES = [A1, B1, C1, D1, E1, F1, G1, H1,
@@ -36,10 +36,13 @@ SQUARES = [A1, B1, C1, D1, E1, F1, G1, H1,
            A5, B5, C5, D5, E5, F5, G5, H5,
            A6, B6, C6, D6, E6, F6, G6, H6,
            A7, B7, C7, D7, E7, F7, G7, H7,
-           A8, B8, C8, D8, E8, F8, G8, H8,] = [1 << i for i in range(64)]
+           A8, B8, C8, D8, E8, F8, G8, H8,] = tuple(1 << i for i in range(64))
 
 # SAN symbols for the squares on the board.
-SQUARE_SAN = [file + rank for rank in RANK_SAN for file in FILE_SAN]
+SQUARE_SAN = tuple(file + rank for rank in RANK_SAN for file in FILE_SAN)
+
+# Square masks keyed by SAN.
+SAN_TO_MASK = {san: 1 << i for i, san in enumerate(SQUARE_SAN)}
 
 # Numbers for the piece types.
 PIECES = [PAWN,
@@ -47,12 +50,16 @@ PIECES = [PAWN,
           BISHOP,
           ROOK,
           QUEEN,
-          KING,] = [1, 2, 3, 4, 5, 6]
+          KING,] = (1, 2, 3, 4, 5, 6)
 
-PIECE_SYMBOLS = ['p', 'n', 'b', 'r', 'q', 'k']
+PIECE_SYMBOLS = ('p', 'n', 'b', 'r', 'q', 'k')
 
 # Numbers for the color types.
-COLORS = [WHITE, BLACK] = [1, 2]
+COLORS = [WHITE, BLACK] = (1, 2)
+
+# Piece types and colors keyed by symbol. White symbols are upper-case.
+SYMBOL_TO_PIECE = {symbol: (piece, BLACK) for piece, symbol in zip(PIECES, PIECE_SYMBOLS)}
+SYMBOL_TO_PIECE.update({symbol.upper(): (piece, WHITE) for piece, symbol in zip(PIECES, PIECE_SYMBOLS)})
 
 class SanError(ValueError):
     '''
@@ -66,18 +73,272 @@ class FenError(ValueError):
     '''
     pass
 
+def popcount(mask):
+    '''
+    Counts the set bits in a mask.
+
+    Params:
+        mask (int): A mask of squares on the board.
+
+    Returns:
+        (int): The number of set bits.
+    '''
+    return mask.bit_count()
+
+def ctz(mask):
+    '''
+    Counts the trailing zero bits in a mask.
+
+    Params:
+        mask (int): A mask of squares on the board.
+
+    Returns:
+        (int): The bit index of the lowest set bit, or -1 if empty.
+    '''
+    return (mask & -mask).bit_length() - 1
+
+def lsb_mask(mask):
+    '''
+    Gets the lowest set bit of a mask.
+
+    Params:
+        mask (int): A mask of squares on the board.
+
+    Returns:
+        (int): A mask with only the lowest set bit.
+    '''
+    return mask & -mask
+
+def pop_lsb(mask):
+    '''
+    Clears the lowest set bit of a mask.
+
+    Params:
+        mask (int): A mask of squares on the board.
+
+    Returns:
+        (int): The mask without its lowest set bit.
+    '''
+    return mask & (mask - 1)
+
+def square_is_legal(mask):
+    '''
+    Checks if a square mask is on the board.
+
+    Params:
+        mask (int): A mask for a square on the board.
+
+    Returns:
+        (bool): If the square is on the board.
+    '''
+    return mask != EMPTY and mask & (mask - 1) == EMPTY and mask <= H8
+
+def square_rank(mask):
+    '''
+    Gets the rank of a square mask.
+
+    Params:
+        mask (int): A mask for a square on the board.
+
+    Returns:
+        (int): The rank mask of the square.
+    '''
+    if not square_is_legal(mask):
+        return EMPTY
+
+    # The rank index is the bit index divided by eight.
+    return RANKS[(mask.bit_length() - 1) >> 3]
+
+def square_file(mask):
+    '''
+    Gets the file of a square mask.
+
+    Params:
+        mask (int): A mask for a square on the board.
+
+    Returns:
+        (int): The file mask of the square.
+    '''
+    if not square_is_legal(mask):
+        return EMPTY
+
+    # The file index is the bit index modulo eight.
+    return FILES[(mask.bit_length() - 1) & 7]
+
+def square_to_san(mask):
+    '''
+    Gets the SAN of a square mask.
+
+    Params:
+        mask (int): A mask for a square on the board.
+
+    Returns:
+        (str): The SAN of the square.
+    '''
+    if not square_is_legal(mask):
+        return ''
+
+    # A legal mask has a single set bit, so its index is one less than
+    # the bit length.
+    return SQUARE_SAN[mask.bit_length() - 1]
+
+def square_from_san(san):
+    '''
+    Gets a square mask from SAN.
+
+    Params:
+        san (str): SAN for a square.
+
+    Returns:
+        (int): The mask of the square.
+    '''
+    mask = SAN_TO_MASK.get(san)
+
+    if mask is None:
+        raise SanError(f'Invalid square \'{san}\'')
+
+    return mask
+
+# Lookup tables for the bulk SAN conversions, built on first use so NumPy
+# stays an optional dependency.
+_BULK_SAN_TABLES = None
+
+def _bulk_san_tables():
+    '''
+    Builds the NumPy lookup tables for the bulk SAN conversions.
+
+    Returns:
+        (tuple): The SAN table, the sorted SAN table, and the sorted masks.
+    '''
+    global _BULK_SAN_TABLES
+
+    if _BULK_SAN_TABLES is None:
+        import numpy as np
+
+        san_array = np.array(SQUARE_SAN)
+        sort_order = np.argsort(san_array)
+        masks = np.array(SQUARES, dtype=np.uint64)
+
+        _BULK_SAN_TABLES = (san_array, san_array[sort_order], masks[sort_order])
+
+    return _BULK_SAN_TABLES
+
+def masks_to_san(masks):
+    '''
+    Gets the SAN for an array of square masks.
+
+    Params:
+        masks (numpy.ndarray): Masks for squares on the board.
+
+    Returns:
+        (numpy.ndarray): The SAN of each square.
+    '''
+    import numpy as np
+
+    san_array, _, _ = _bulk_san_tables()
+    masks = np.asarray(masks, dtype=np.uint64)
+
+    if (masks == 0).any() or (masks & (masks - np.uint64(1))).any():
+        raise SanError('Invalid square mask')
+
+    # A legal mask has a single set bit, so its index is the base-two
+    # logarithm of its value.
+    return san_array[np.log2(masks).astype(np.int64)]
+
+def sans_to_masks(sans):
+    '''
+    Gets the square masks for an array of SAN.
+
+    Params:
+        sans (numpy.ndarray): SAN for squares on the board.
+
+    Returns:
+        (numpy.ndarray): The mask of each square.
+    '''
+    import numpy as np
+
+    _, sorted_san, sorted_masks = _bulk_san_tables()
+    sans = np.asarray(sans)
+
+    indices = np.searchsorted(sorted_san, sans)
+
+    if (indices >= len(sorted_san)).any() or (sorted_san[indices % len(sorted_san)] != sans).any():
+        raise SanError('Invalid square SAN')
+
+    return sorted_masks[indices]
+
+def piece_code(piece, color):
+    '''
+    Packs a piece type and color into a single piece code.
+
+    Params:
+        piece (int): A piece type.
+        color (int): A piece color.
+
+    Returns:
+        (int): The piece code.
+    '''
+    return (color << 3) | piece
+
+def piece_to_symbol(code):
+    '''
+    Gets the symbol for a piece code.
+
+    Params:
+        code (int): A piece code.
+
+    Returns:
+        (str): The symbol.
+    '''
+    piece = code & 0x7
+    color = code >> 3
+
+    if not piece in PIECES or not color in COLORS:
+        return ''
+
+    # The piece types count up from one, so the symbol index is one less
+    # than the piece type.
+    symbol = PIECE_SYMBOLS[piece - 1]
+
+    # White pieces are upper-case.
+    if color == WHITE:
+        symbol = symbol.upper()
+
+    return symbol
+
+def piece_from_symbol(symbol):
+    '''
+    Gets a piece code from a symbol.
+
+    Params:
+        symbol (str): A symbol.
+
+    Returns:
+        (int): The piece code.
+    '''
+    # Get the piece type and color.
+    piece_color = SYMBOL_TO_PIECE.get(symbol)
+
+    if piece_color is None:
+        raise FenError(f'Invalid symbol \'{symbol}\'')
+
+    return piece_code(*piece_color)
+
 class Square:
+    __slots__ = ('mask', '_san')
+
     def __init__(self, mask=EMPTY):
         '''
         Creates a square.
 
         Params:
             mask (int): A mask for the square on the board.
-        
+
         Returns:
             (chess.Square): The new square.
         '''
         self.mask = mask
+        self._san = None
 
     def __repr__(self):
         '''
@@ -95,7 +356,7 @@ class Square:
         Returns:
             (bool): If the square is on the board.
         '''
-        return self.mask in SQUARES
+        return square_is_legal(self.mask)
 
     def to_rank(self):
         '''
@@ -104,7 +365,7 @@ class Square:
         Returns:
             (int): The rank mask of the square.
         '''
-        return next((rank for rank in RANKS if self.mask & rank), EMPTY)
+        return square_rank(self.mask)
 
     def to_file(self):
         '''
@@ -113,7 +374,7 @@ class Square:
         Returns:
             (int): The file mask of the square.
         '''
-        return next((file for file in FILES if self.mask & file), EMPTY)
+        return square_file(self.mask)
 
     def to_san(self):
         '''
@@ -122,13 +383,11 @@ class Square:
         Returns:
             (str): The SAN of the square.
         '''
-        if not self.is_legal():
-            return ''
-
-        # Get the SAN of the square.
-        san_index = SQUARES.index(self.mask)
+        # The mask never changes after construction, so cache the SAN.
+        if self._san is None:
+            self._san = square_to_san(self.mask)
 
-        return SQUARE_SAN[san_index]
+        return self._san
 
     @classmethod
     def from_san(cls, san):
@@ -141,15 +400,11 @@ class Square:
         Returns:
             (chess.Square): The new square.
         '''
-        if not san in SQUARE_SAN:
-            raise SanError(f'Invalid square \'{san}\'')
-
-        # Get the square mask.
-        mask_index = SQUARE_SAN.index(san)
-
-        return Square(SQUARES[mask_index])
+        return Square(square_from_san(san))
 
 class Piece:
+    __slots__ = ('piece', 'color', '_symbol')
+
     def __init__(self, piece, color):
         '''
         Creates a piece.
@@ -163,6 +418,7 @@ class Piece:
         '''
         self.piece = piece
         self.color = color
+        self._symbol = None
 
     def __repr__(self):
         '''
@@ -180,18 +436,17 @@ class Piece:
         Returns:
             (str): The symbol.
         '''
+        # Check the raw attributes before packing, since a piece type that
+        # does not fit its bit field would alias into the color field.
         if not self.piece in PIECES or not self.color in COLORS:
             return ''
 
-        # Get the piece symbol.
-        symbol_index = PIECES.index(self.piece)
-        symbol = PIECE_SYMBOLS[symbol_index]
+        # The piece and color never change after construction, so cache
+        # the symbol.
+        if self._symbol is None:
+            self._symbol = piece_to_symbol(piece_code(self.piece, self.color))
 
-        # White pieces are upper-case.
-        if self.color == WHITE:
-            symbol = symbol.upper()
-
-        return symbol
+        return self._symbol
 
     @classmethod
     def from_symbol(cls, symbol):
@@ -204,14 +459,6 @@ class Piece:
         Returns:
             (chess.Piece): The new peice.
         '''
-        lower_symbol = symbol.lower()
-        
-        if not lower_symbol in PIECE_SYMBOLS:
-            raise FenError(f'Invalid symbol \'{symbol}\'')
-
-        # Get the piece type and color.
-        piece_index = PIECE_SYMBOLS.index(lower_symbol)
-        piece = PIECES[piece_index]
-        color = WHITE if symbol.isupper() else BLACK
+        code = piece_from_symbol(symbol)
 
-        return Piece(piece, color)
+        return Piece(code & 0x7, code >> 3)
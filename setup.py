@@ -0,0 +1,17 @@
+from setuptools import setup
+
+# Compile chess.py to a C extension when Cython is available. The pure
+# Python module works the same without it.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize('chess.py', language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(name='chess',
+      version='0.1.0',
+      description='Implementation of a chess engine in Python.',
+      python_requires='>=3.10',
+      py_modules=['chess'],
+      ext_modules=ext_modules)